@@ -104,6 +104,33 @@ class TestRepositoryPagination:
         assert len(result.items) == 10
         assert result.items[0].name == "Item 11"
 
+    @pytest.mark.asyncio
+    async def test_paginate_concurrent_count(self):
+        """Test that concurrent_count runs the count on a second session with identical results."""
+        repo = ItemModelRepository()
+        params = PageParams(page=2, size=10)
+
+        async with repo.session() as session:
+            stmt = select(ItemModel).order_by(ItemModel.id)
+            result = await repo.paginate(session, stmt, params, concurrent_count=True)
+
+            assert result.total == 25
+            assert len(result.items) == 10
+            assert result.items[0].name == "Item 11"
+
+    @pytest.mark.asyncio
+    async def test_paginate_explicit_select_from(self):
+        """An explicit select_from must use the subquery fallback, not the fast count."""
+        repo = ItemModelRepository()
+        params = PageParams(page=1, size=10)
+
+        stmt = select(ItemModel).select_from(ItemModel).where(ItemModel.name <= "Item 05")
+        count_stmt = repo._build_count_stmt(stmt)
+        assert "anon" in str(count_stmt).lower()  # subquery path
+
+        result = await repo.paginate_query(stmt, params)
+        assert result.total == 5
+
     @pytest.mark.asyncio
     async def test_paginate_empty_result(self):
         """Test pagination on a query that returns no results."""
@@ -8,6 +8,7 @@ from sqlmodel import Field, SQLModel
 from zodiac_core.db.session import (
     DEFAULT_DB_NAME,
     DatabaseManager,
+    SessionProvider,
     db,
     get_session,
     init_db_resource,
@@ -93,6 +94,68 @@ class TestDatabaseManager:
         await db.shutdown()
 
 
+class TestReadOnlySession:
+    """Tests for the read-only session context manager."""
+
+    @pytest.mark.asyncio
+    async def test_readonly_session_reads(self):
+        """Verify readonly_session yields a tagged, working session."""
+        if db._engines:
+            await db.shutdown()
+
+        db.setup("sqlite+aiosqlite:///:memory:")
+        try:
+            async with db.readonly_session() as session:
+                assert isinstance(session, AsyncSession)
+                assert session.info.get("readonly") is True
+                await session.execute(text("SELECT 1"))
+        finally:
+            await db.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_readonly_session_skips_rollback(self):
+        """Verify the read-only CM closes without rolling back on error."""
+        from zodiac_core.db.session import manage_session_ro
+
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_factory = MagicMock(return_value=mock_session)
+
+        with pytest.raises(ValueError, match="Read Error"):
+            async with manage_session_ro(mock_factory):
+                raise ValueError("Read Error")
+
+        mock_session.rollback.assert_not_awaited()
+        mock_session.close.assert_awaited_once()
+
+
+class TestPoolWarmup:
+    """Tests for the connection-pool warmup helper."""
+
+    @pytest.mark.asyncio
+    async def test_warmup_pool(self):
+        """Verify warmup_pool opens and releases connections without error."""
+        if db._engines:
+            await db.shutdown()
+
+        db.setup("sqlite+aiosqlite:///:memory:")
+        try:
+            await db.warmup_pool(count=1)
+            # The pool must still hand out working connections afterwards
+            async with db.session() as session:
+                await session.execute(text("SELECT 1"))
+        finally:
+            await db.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_warmup_requires_setup(self):
+        """Verify warmup_pool raises for unknown databases."""
+        if db._engines:
+            await db.shutdown()
+
+        with pytest.raises(RuntimeError, match="not initialized"):
+            await db.warmup_pool("missing")
+
+
 class TestSessionManagement:
     """Tests for session lifecycle handling and helper functions."""
 
@@ -139,6 +202,43 @@ class TestSessionManagement:
             await db.shutdown()
 
 
+class TestMultiSessionContext:
+    """Tests for the concurrent multi-database session context manager."""
+
+    @pytest.mark.asyncio
+    async def test_sessions_across_databases(self):
+        """Verify db.sessions() yields one working session per named database."""
+        if db._engines:
+            await db.shutdown()
+
+        db.setup("sqlite+aiosqlite:///:memory:", name="first")
+        db.setup("sqlite+aiosqlite:///:memory:", name="second")
+        try:
+            async with db.sessions("first", "second") as (first, second):
+                assert isinstance(first, AsyncSession)
+                assert isinstance(second, AsyncSession)
+                await first.execute(text("SELECT 1"))
+                await second.execute(text("SELECT 1"))
+        finally:
+            await db.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_sessions_rollback_on_error(self):
+        """Verify all sessions are rolled back and closed when the block raises."""
+        mock_sessions = [AsyncMock(spec=AsyncSession) for _ in range(2)]
+        factories = [MagicMock(return_value=s) for s in mock_sessions]
+
+        from zodiac_core.db.session import _MultiSessionCM
+
+        with pytest.raises(ValueError, match="Multi DB Error"):
+            async with _MultiSessionCM(factories):
+                raise ValueError("Multi DB Error")
+
+        for mock_session in mock_sessions:
+            mock_session.rollback.assert_awaited_once()
+            mock_session.close.assert_awaited_once()
+
+
 class TestDependencyIntegration:
     """Tests for framework-specific dependency providers."""
 
@@ -159,6 +259,28 @@ class TestDependencyIntegration:
             # Explicit check after cleanup
             assert "default" not in db._engines
 
+    @pytest.mark.asyncio
+    async def test_session_provider_dependency(self):
+        """Verify SessionProvider is coroutine-native and yields a working session."""
+        import inspect
+
+        if db._engines:
+            await db.shutdown()
+
+        db.setup("sqlite+aiosqlite:///:memory:")
+        provider = SessionProvider()
+        # The solver must see an async generator, never the threadpool path
+        assert inspect.isasyncgenfunction(provider.__call__)
+
+        gen = provider()
+        try:
+            session = await anext(gen)
+            assert isinstance(session, AsyncSession)
+            await session.execute(text("SELECT 1"))
+        finally:
+            await gen.aclose()
+            await db.shutdown()
+
     @pytest.mark.parametrize("name, url, connect_args", DB_URLS)
     @pytest.mark.asyncio
     async def test_get_session_fastapi_dependency(self, name, url, connect_args):
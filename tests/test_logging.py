@@ -73,6 +73,36 @@ async def test_setup_loguru_json_file_output_with_options():
             assert "json-service" in line
 
 
+@pytest.mark.asyncio
+async def test_json_exception_logging_is_valid_ndjson():
+    """logger.exception must stay one parseable JSON line with exception info."""
+    import json
+
+    log_capture = []
+    setup_loguru(
+        level="INFO",
+        json_format=True,
+        service_name="exc-service",
+        console_options={"sink": log_capture.append, "enqueue": False},
+    )
+
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Something failed")
+    logger.remove()
+
+    # Every captured line must parse on its own (no trailing raw traceback)
+    entries = [json.loads(line) for line in log_capture]
+    entry = entries[-1]
+
+    assert "Traceback" in entry["text"]
+    exc = entry["record"]["exception"]
+    assert exc["type"] == "ValueError"
+    assert "boom" in str(exc["value"])
+    assert exc["traceback"] is True
+
+
 @pytest.mark.asyncio
 async def test_setup_loguru_with_pydantic_options():
     with tempfile.TemporaryDirectory() as tmp_dir:
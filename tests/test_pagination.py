@@ -54,6 +54,23 @@ class TestPagedResponse:
         assert resp.page == 1
         assert resp.size == 10
 
+    def test_create_json_matches_model_dump(self):
+        """create_json must emit the same JSON as the model-based path."""
+        import json
+
+        items = [UserDTO(id=1, name="Alice"), UserDTO(id=2, name="Bob")]
+        params = PageParams(page=2, size=5)
+
+        body = PagedResponse.create_json(items, 42, params)
+        expected = PagedResponse[UserDTO].create(items, 42, params).model_dump(mode="json")
+        assert json.loads(body) == expected
+
+    def test_create_json_empty_page(self):
+        import json
+
+        body = PagedResponse.create_json([], 0, PageParams())
+        assert json.loads(body) == {"items": [], "total": 0, "page": 1, "size": 20}
+
 
 class TestPaginationIntegration:
     """Integration tests with FastAPI to verify Query model mapping."""
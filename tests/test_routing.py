@@ -171,3 +171,51 @@ class TestRoutingInternalLogic:
 
         # 4. Union types (Lines 69-70: TypeError in issubclass)
         assert ZodiacRoute._should_wrap(Union[User, None]) is True
+
+    def test_fast_path_dispatch(self):
+        """Dependency-free response-returning endpoints use the direct handler."""
+        from fastapi.responses import JSONResponse
+
+        app = FastAPI()
+        router = ZodiacAPIRouter()
+
+        @router.get("/ping")
+        async def ping() -> JSONResponse:
+            return JSONResponse({"ok": True})
+
+        @router.get("/wrapped")
+        async def wrapped():
+            return {"ok": True}
+
+        app.include_router(router)
+
+        routes = {route.path: route for route in router.routes if isinstance(route, ZodiacRoute)}
+        assert routes["/ping"]._fast_path is not None
+        assert routes["/wrapped"]._fast_path is None
+
+        client = TestClient(app)
+        assert client.get("/ping").json() == {"ok": True}
+        assert client.get("/wrapped").json()["data"] == {"ok": True}
+
+    def test_fast_path_disabled_by_dependencies(self):
+        """Route- or router-level dependencies must keep the dependency solver."""
+        from fastapi import Depends, HTTPException
+        from fastapi.responses import JSONResponse
+
+        async def require_auth():
+            raise HTTPException(status_code=401)
+
+        app = FastAPI()
+        router = ZodiacAPIRouter(dependencies=[Depends(require_auth)])
+
+        @router.get("/guarded")
+        async def guarded() -> JSONResponse:
+            return JSONResponse({"ok": True})
+
+        app.include_router(router)
+
+        guarded_route = next(route for route in router.routes if route.path == "/guarded")
+        assert guarded_route._fast_path is None
+
+        client = TestClient(app)
+        assert client.get("/guarded").status_code == 401
@@ -9,6 +9,22 @@ from loguru import logger
 
 T = TypeVar("T")
 
+# Cache for resolved environment names, keyed by (env_var, raw value): a
+# modified variable changes the key itself, so a stale name can never be
+# served (unlike a len(os.environ)-based invalidator, which misses in-place
+# changes to existing variables).
+_env_cache: dict = {}
+
+
+def _cached_env(env_var: str, default_env: str) -> str:
+    """Resolve the lowercased target environment, caching repeated lookups."""
+    key = (env_var, os.environ.get(env_var, default_env))
+    value = _env_cache.get(key)
+    if value is None:
+        value = key[1].lower()
+        _env_cache[key] = value
+    return value
+
 
 class Environment(str, Enum):
     """
@@ -70,7 +86,7 @@ class ConfigManagement:
             ```
         """
 
-        target_env = os.environ.get(env_var, default_env).lower()
+        target_env = _cached_env(env_var, default_env)
         base_files = []
         env_files = []
 
@@ -2,6 +2,7 @@ from zodiac_core.db.repository import BaseSQLRepository
 from zodiac_core.db.session import (
     DEFAULT_DB_NAME,
     DatabaseManager,
+    SessionProvider,
     db,
     get_session,
     init_db_resource,
@@ -21,6 +22,7 @@ __all__ = [
     # session
     "DEFAULT_DB_NAME",
     "DatabaseManager",
+    "SessionProvider",
     "db",
     "get_session",
     "init_db_resource",
@@ -1,5 +1,7 @@
-from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Optional, Type, TypeVar
+import asyncio
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from pydantic import TypeAdapter
 
 try:
     from sqlalchemy import func, select
@@ -10,11 +12,24 @@ except ImportError as e:
         "Please install it with: pip install 'zodiac-core[sql]'"
     ) from e
 
-from zodiac_core.db.session import DEFAULT_DB_NAME, db, manage_session
+from zodiac_core.db.session import DEFAULT_DB_NAME, _SessionCM, db, manage_session
 from zodiac_core.pagination import PagedResponse, PageParams
 
 T = TypeVar("T")
 
+# Cache of TypeAdapter(List[transformer]) per transformer class.
+# Batch validation through pydantic-core dispatches once per page instead of once per row.
+_adapter_cache: Dict[type, TypeAdapter] = {}
+
+
+def _get_list_adapter(transformer: type) -> TypeAdapter:
+    """Get (or lazily build) the cached list adapter for a transformer model."""
+    adapter = _adapter_cache.get(transformer)
+    if adapter is None:
+        adapter = TypeAdapter(List[transformer])
+        _adapter_cache[transformer] = adapter
+    return adapter
+
 
 class BaseSQLRepository:
     """
@@ -22,8 +37,16 @@ class BaseSQLRepository:
 
     Supports multiple database instances via `db_name` and provides
     professional utilities for common operations like pagination.
+
+    Note:
+        Instances are slotted (no per-instance `__dict__`), which halves the
+        footprint of per-request repositories created via Depends. Subclasses
+        that add attributes should declare their own `__slots__` to keep
+        the benefit.
     """
 
+    __slots__ = ("_session_factory", "db_name", "options")
+
     def __init__(
         self,
         session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
@@ -42,8 +65,7 @@ class BaseSQLRepository:
         self.db_name = db_name
         self.options = options
 
-    @asynccontextmanager
-    async def session(self) -> AsyncIterator[AsyncSession]:
+    def session(self) -> _SessionCM:
         """
         Async context manager for obtaining a database session.
         Uses the injected factory or resolves one from the global 'db' via 'db_name'.
@@ -52,9 +74,35 @@ class BaseSQLRepository:
             This context manager does NOT auto-commit. You must explicitly call
             `await session.commit()` to persist changes to the database.
         """
-        factory = self._session_factory or db.get_factory(self.db_name)
-        async with manage_session(factory) as session:
-            yield session
+        # Prefer the fast constructor when no custom factory was injected; it
+        # builds AsyncSession directly with pre-bound kwargs.
+        factory = self._session_factory or db.get_fast_ctor(self.db_name)
+        return manage_session(factory)
+
+    @staticmethod
+    def _build_count_stmt(count_base: Any) -> Any:
+        """
+        Build the COUNT statement for a (limit/offset-free) select.
+
+        Simple single-entity selects without joins/grouping/distinct count the
+        entity directly ('SELECT count(*) FROM table WHERE ...'), which lets the
+        planner use indexes. Anything more complex falls back to wrapping the
+        statement in a subquery, which handles joins and group_by correctly.
+        """
+        if (
+            len(count_base.column_descriptions) == 1
+            and not count_base._group_by_clauses
+            and not count_base._distinct
+            and not count_base._setup_joins
+            and not count_base._from_obj
+        ):
+            entity = count_base.column_descriptions[0]["entity"]
+            if entity is not None:
+                count_stmt = select(func.count()).select_from(entity)
+                if count_base.whereclause is not None:
+                    count_stmt = count_stmt.where(count_base.whereclause)
+                return count_stmt
+        return select(func.count()).select_from(count_base.subquery())
 
     async def paginate(
         self,
@@ -62,6 +110,7 @@ class BaseSQLRepository:
         statement: Any,
         params: PageParams,
         transformer: Optional[Type[T]] = None,
+        concurrent_count: bool = False,
     ) -> PagedResponse[T]:
         """
         Execute a paginated query with automatic count and paging.
@@ -76,6 +125,10 @@ class BaseSQLRepository:
             statement: The SQLAlchemy select statement (without limit/offset).
             params: Standard PageParams (page, size).
             transformer: Optional Pydantic model to transform DB objects into.
+            concurrent_count: Run the count query on a second session concurrently
+                with the page query. Halves latency when the DB round-trip dominates,
+                but checks out an extra pool connection — only enable when the pool
+                has headroom.
 
         Example:
             ```python
@@ -85,29 +138,54 @@ class BaseSQLRepository:
             ```
         """
         # 1. Execute Count Query
-        # Remove limit/offset (if any) for count query, then wrap in subquery
-        # subquery() handles order_by correctly, and wrapping in subquery handles complex queries (joins, groups)
-        count_base = statement.limit(None).offset(None)
-        count_stmt = select(func.count()).select_from(count_base.subquery())
-        total = (await session.execute(count_stmt)).scalar() or 0
-
-        # 2. Execute Paged Query
+        # Strip limit/offset for the count, cloning the statement only when one is actually set.
+        if statement._limit_clause is not None or statement._offset_clause is not None:
+            count_base = statement.limit(None).offset(None)
+        else:
+            count_base = statement
+        count_stmt = self._build_count_stmt(count_base)
+
+        # 2. Execute Count + Paged Queries
         skip = (params.page - 1) * params.size
         paged_stmt = statement.offset(skip).limit(params.size)
-        result = await session.execute(paged_stmt)
-        items = result.scalars().all()
 
-        # 3. Optional Transformation
+        if concurrent_count:
+            # Both queries are independent: run the count on its own session so
+            # they overlap instead of serializing on one connection.
+            factory = self._session_factory or db.get_factory(self.db_name)
+
+            async def _count() -> int:
+                async with manage_session(factory) as count_session:
+                    return (await count_session.execute(count_stmt)).scalar() or 0
+
+            async def _page():
+                return (await session.execute(paged_stmt)).scalars().all()
+
+            # TaskGroup (not gather): if one query fails the sibling is
+            # cancelled and awaited before the exception propagates, so the
+            # caller's session is never rolled back while its page query is
+            # still in flight.
+            async with asyncio.TaskGroup() as tg:
+                count_task = tg.create_task(_count())
+                page_task = tg.create_task(_page())
+            total, items = count_task.result(), page_task.result()
+        else:
+            total = (await session.execute(count_stmt)).scalar() or 0
+            result = await session.execute(paged_stmt)
+            items = result.scalars().all()  # already materialized as a list
+
+        # 3. Optional Transformation (batch-validated in a single pydantic-core call)
         if transformer:
-            items = [transformer.model_validate(item) for item in items]
+            items = _get_list_adapter(transformer).validate_python(items, from_attributes=True)
 
-        return PagedResponse.create(items=list(items), total=total, params=params)
+        return PagedResponse.create(items=items, total=total, params=params)
 
     async def paginate_query(
         self,
         statement: Any,
         params: PageParams,
         transformer: Optional[Type[T]] = None,
+        concurrent_count: bool = False,
     ) -> PagedResponse[T]:
         """
         Convenience method that automatically manages session for pagination.
@@ -119,6 +197,7 @@ class BaseSQLRepository:
             statement: The SQLAlchemy select statement (without limit/offset).
             params: Standard PageParams (page, size).
             transformer: Optional Pydantic model to transform DB objects into.
+            concurrent_count: See `paginate()`; requires pool headroom.
 
         Example:
             ```python
@@ -128,4 +207,4 @@ class BaseSQLRepository:
             ```
         """
         async with self.session() as session:
-            return await self.paginate(session, statement, params, transformer)
+            return await self.paginate(session, statement, params, transformer, concurrent_count=concurrent_count)
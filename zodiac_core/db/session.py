@@ -1,16 +1,18 @@
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator, Dict, Optional
+import asyncio
+import os
+from typing import Any, AsyncGenerator, Dict, Optional, Tuple
 
 from loguru import logger
 
 try:
-    from sqlalchemy import text
+    from sqlalchemy.engine import make_url
     from sqlalchemy.ext.asyncio import (
         AsyncEngine,
         AsyncSession,
         async_sessionmaker,
         create_async_engine,
     )
+    from sqlalchemy.pool import StaticPool
     from sqlmodel import SQLModel
 except ImportError as e:
     raise ImportError(
@@ -22,8 +24,90 @@ except ImportError as e:
 DEFAULT_DB_NAME = "default"
 
 
-@asynccontextmanager
-async def manage_session(factory: async_sessionmaker[AsyncSession]) -> AsyncGenerator[AsyncSession, None]:
+class _SessionCM:
+    """
+    Minimal async context manager driving the AsyncSession lifecycle.
+
+    A plain `__aenter__`/`__aexit__` class avoids the generator state machine
+    (and its extra coroutine hops) that `@asynccontextmanager` adds to every
+    session acquisition — relevant for code entered on every request.
+    """
+
+    __slots__ = ("_factory", "_session")
+
+    def __init__(self, factory: async_sessionmaker[AsyncSession]) -> None:
+        self._factory = factory
+
+    async def __aenter__(self) -> AsyncSession:
+        self._session = self._factory()
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        session = self._session
+        try:
+            if exc_type is not None:
+                await session.rollback()
+        finally:
+            await session.close()
+
+
+class _ReadOnlySessionCM:
+    """
+    Session context manager for read-only work.
+
+    Skips the rollback-on-error step entirely — there is nothing to roll back
+    for GET-style endpoints — so teardown is a single close() await.
+    """
+
+    __slots__ = ("_factory", "_session")
+
+    def __init__(self, factory: async_sessionmaker[AsyncSession]) -> None:
+        self._factory = factory
+
+    async def __aenter__(self) -> AsyncSession:
+        self._session = self._factory()
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._session.close()
+
+
+def manage_session_ro(factory: async_sessionmaker[AsyncSession]) -> _ReadOnlySessionCM:
+    """
+    Lifecycle management for read-only sessions: close always, no rollback.
+    Pair with a factory configured for reads (see `db.readonly_session`).
+    """
+    return _ReadOnlySessionCM(factory)
+
+
+class _MultiSessionCM:
+    """
+    Context manager over several sessions at once (one per requested database).
+
+    Rollback and close run concurrently via `asyncio.gather`, so teardown cost
+    stays flat as the number of databases grows. Connection checkout itself is
+    lazy in SQLAlchemy and overlaps naturally once the sessions start executing.
+    """
+
+    __slots__ = ("_factories", "_sessions")
+
+    def __init__(self, factories) -> None:
+        self._factories = factories
+
+    async def __aenter__(self) -> Tuple[AsyncSession, ...]:
+        self._sessions = tuple(factory() for factory in self._factories)
+        return self._sessions
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        sessions = self._sessions
+        try:
+            if exc_type is not None:
+                await asyncio.gather(*(s.rollback() for s in sessions), return_exceptions=True)
+        finally:
+            await asyncio.gather(*(s.close() for s in sessions), return_exceptions=True)
+
+
+def manage_session(factory: async_sessionmaker[AsyncSession]) -> _SessionCM:
     """
     Standardizes the lifecycle management of an AsyncSession.
     Ensures rollback on error and proper closure.
@@ -39,14 +123,7 @@ async def manage_session(factory: async_sessionmaker[AsyncSession]) -> AsyncGene
             await session.commit()  # Required to persist changes
         ```
     """
-    session: AsyncSession = factory()
-    try:
-        yield session
-    except Exception:
-        await session.rollback()
-        raise
-    finally:
-        await session.close()
+    return _SessionCM(factory)
 
 
 class DatabaseManager:
@@ -97,14 +174,27 @@ class DatabaseManager:
         ```
     """
 
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._engines: Dict[str, AsyncEngine] = {}
-            cls._instance._session_factories: Dict[str, async_sessionmaker[AsyncSession]] = {}
-        return cls._instance
+    _engines: Dict[str, AsyncEngine]
+    _session_factories: Dict[str, async_sessionmaker[AsyncSession]]
+    _fast_session_ctors: Dict[str, Any]
+    _readonly_factories: Dict[str, async_sessionmaker[AsyncSession]]
+
+    def __init_subclass__(cls, **kwargs):
+        raise TypeError("DatabaseManager is a singleton and cannot be subclassed; use the module-level 'db' instance.")
+
+    def __new__(cls) -> "DatabaseManager":
+        # The module-level `db` below is the one true instance: once the module
+        # has finished importing, re-instantiation is a plain global read with
+        # no state checks or re-initialization (and no startup race).
+        existing = globals().get("db")
+        if existing is not None:
+            return existing
+        self = super().__new__(cls)
+        self._engines = {}
+        self._session_factories = {}
+        self._fast_session_ctors = {}
+        self._readonly_factories = {}
+        return self
 
     def get_engine(self, name: str = DEFAULT_DB_NAME) -> AsyncEngine:
         """Access a specific SQLAlchemy AsyncEngine by name."""
@@ -118,6 +208,18 @@ class DatabaseManager:
             raise RuntimeError(f"Session factory for '{name}' is not initialized. Call db.setup(name='{name}') first.")
         return self._session_factories[name]
 
+    def get_fast_ctor(self, name: str = DEFAULT_DB_NAME):
+        """
+        Access the fast session constructor for a named engine.
+
+        The constructor builds AsyncSession directly with pre-bound kwargs,
+        skipping the config-merge that `async_sessionmaker.__call__` performs
+        on every invocation. Equivalent to calling `get_factory(name)()`.
+        """
+        if name not in self._fast_session_ctors:
+            raise RuntimeError(f"Session factory for '{name}' is not initialized. Call db.setup(name='{name}') first.")
+        return self._fast_session_ctors[name]
+
     @property
     def engine(self) -> AsyncEngine:
         """Access the default SQLAlchemy AsyncEngine."""
@@ -133,49 +235,156 @@ class DatabaseManager:
         database_url: str,
         name: str = DEFAULT_DB_NAME,
         echo: bool = False,
-        pool_size: int = 10,
-        max_overflow: int = 20,
-        pool_pre_ping: bool = True,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_timeout: float = 10.0,
+        pool_pre_ping: bool = False,
+        pool_recycle: int = 3600,
         connect_args: Optional[dict] = None,
+        warmup: int = 0,
         **kwargs,
     ) -> None:
-        """Initialize an Async Engine and Session Factory with a specific name."""
+        """
+        Initialize an Async Engine and Session Factory with a specific name.
+
+        Args:
+            pool_size: Connections to keep pooled (non-SQLite engines).
+                Defaults to 20 when omitted.
+            max_overflow: Extra connections allowed beyond pool_size.
+                Defaults to 40 when omitted.
+            pool_timeout: Seconds to wait for a pooled connection before
+                raising, instead of SQLAlchemy's 30s default. Under async
+                workers `pool_size + max_overflow` caps the number of
+                concurrent DB-touching coroutines; when exhausted, callers
+                queue up to this long.
+            pool_pre_ping: Issue a liveness round-trip before every checkout.
+                Off by default: it costs one RTT per session acquisition on the
+                hot path. Stale connections are handled by pool_recycle instead;
+                enable pre-ping only for networks that drop idle connections
+                unpredictably.
+            pool_recycle: Recycle pooled connections older than this many
+                seconds (non-SQLite engines), avoiding stale-connection errors
+                without per-checkout pings.
+            warmup: Number of pooled connections to pre-open in the background
+                after engine creation. SQLAlchemy's pool is lazy by default, so
+                without warmup the first requests pay TCP/TLS/auth latency.
+                Requires a running event loop; use `warmup_pool()` directly
+                (or `init_db_resource(warmup=...)`) to await completion.
+        """
         if name in self._engines:
             logger.warning(f"Database '{name}' is already configured, skipping duplicate setup.")
             return
 
+        # Parse once instead of substring-scanning the URL; dispatch by backend.
+        url = make_url(database_url)
+
         engine_args = {
             "echo": echo,
             "pool_pre_ping": pool_pre_ping,
-            "connect_args": connect_args or {},
             **kwargs,
         }
-
-        if "sqlite" not in database_url:
+        # Only forward connect_args when actually provided: avoids allocating an
+        # empty dict and stops the explicit parameter from clobbering a
+        # connect_args the caller may have passed through **kwargs.
+        if connect_args is not None:
+            engine_args["connect_args"] = connect_args
+
+        if url.get_backend_name() == "sqlite":
+            # SQLite wants a single shared connection: StaticPool avoids connection
+            # thrash under async drivers and keeps :memory: databases visible across
+            # sessions. check_same_thread is safe since access is serialized.
+            engine_args.setdefault("poolclass", StaticPool)
+            engine_args["connect_args"] = {"check_same_thread": False, **engine_args.get("connect_args", {})}
+            # Local-file connections don't silently die like TCP ones, so a
+            # pre-checkout ping is pure overhead — force it off, even if asked.
+            if engine_args.get("pool_pre_ping"):
+                logger.info(f"Database '{name}': pool_pre_ping disabled (no-op for SQLite).")
+            engine_args["pool_pre_ping"] = False
+        else:
+            # None means "library default"; the sizing warning below only ever
+            # fires for explicitly configured pools — the defaults must not
+            # warn about themselves, and the cpu-count heuristic reads host
+            # CPUs (not cgroup limits), so it over-triggers in containers.
+            explicit_sizing = pool_size is not None or max_overflow is not None
+            if pool_size is None:
+                pool_size = 20
+            if max_overflow is None:
+                max_overflow = 40
             engine_args["pool_size"] = pool_size
             engine_args["max_overflow"] = max_overflow
-
-        engine = create_async_engine(database_url, **engine_args)
+            engine_args["pool_timeout"] = pool_timeout
+            engine_args["pool_recycle"] = pool_recycle
+            expected_concurrency = (os.cpu_count() or 1) * 8
+            if explicit_sizing and pool_size + max_overflow < expected_concurrency:
+                logger.warning(
+                    f"Database '{name}': pool_size + max_overflow "
+                    f"({pool_size + max_overflow}) is below the expected async "
+                    f"concurrency (~{expected_concurrency}); coroutines may block "
+                    f"waiting for connections."
+                )
+
+        # Hand the parsed URL object over so SQLAlchemy doesn't re-parse the string
+        engine = create_async_engine(url, **engine_args)
         factory = async_sessionmaker(
             bind=engine,
             class_=AsyncSession,
             expire_on_commit=False,
             autoflush=False,
+            info={"zodiac": True},
+        )
+
+        # Fast path constructor: same configuration as `factory`, but built once
+        # so per-request acquisition skips async_sessionmaker.__call__ overhead.
+        session_kwargs = {"bind": engine, "expire_on_commit": False, "autoflush": False, "info": {"zodiac": True}}
+
+        def fast_ctor() -> AsyncSession:
+            return AsyncSession(**session_kwargs)
+
+        # Dedicated read-only factory: same pooling, tagged via info so callers
+        # (and listeners) can tell reads apart; used by readonly_session().
+        readonly_factory = async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+            info={"zodiac": True, "readonly": True},
         )
 
         self._engines[name] = engine
+        self._readonly_factories[name] = readonly_factory
         self._session_factories[name] = factory
+        self._fast_session_ctors[name] = fast_ctor
         logger.info(f"Database '{name}' initialized successfully.")
 
+        if warmup > 0:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                logger.warning(f"Pool warmup for '{name}' skipped: no running event loop. Await warmup_pool() instead.")
+            else:
+                loop.create_task(self.warmup_pool(name, warmup))
+
+    async def warmup_pool(self, name: str = DEFAULT_DB_NAME, count: int = 1) -> None:
+        """
+        Pre-open `count` pooled connections concurrently and return them to the pool.
+
+        Eliminates cold-start connection latency for the first `count` requests.
+        """
+        engine = self.get_engine(name)
+        conns = await asyncio.gather(*(engine.connect() for _ in range(count)))
+        await asyncio.gather(*(conn.close() for conn in conns))
+        logger.info(f"Database '{name}' pool warmed with {count} connection(s).")
+
     async def shutdown(self) -> None:
-        """Dispose of all registered engines and clear factories."""
-        for engine in self._engines.values():
-            await engine.dispose()
+        """Dispose of all registered engines concurrently and clear factories."""
+        if self._engines:
+            await asyncio.gather(*(engine.dispose() for engine in self._engines.values()), return_exceptions=True)
         self._engines.clear()
         self._session_factories.clear()
+        self._fast_session_ctors.clear()
+        self._readonly_factories.clear()
 
-    @asynccontextmanager
-    async def session(self, name: str = DEFAULT_DB_NAME) -> AsyncGenerator[AsyncSession, None]:
+    def session(self, name: str = DEFAULT_DB_NAME) -> _SessionCM:
         """
         Context Manager for obtaining a NEW database session from a specific engine.
 
@@ -190,8 +399,38 @@ class DatabaseManager:
                 await session.commit()  # Required to persist changes
             ```
         """
-        async with manage_session(self.get_factory(name)) as session:
-            yield session
+        return manage_session(self.get_factory(name))
+
+    def readonly_session(self, name: str = DEFAULT_DB_NAME) -> _ReadOnlySessionCM:
+        """
+        Context Manager for a read-only session: lighter teardown (no rollback
+        path) for GET-style endpoints that never write.
+
+        Example:
+            ```python
+            async with db.readonly_session() as session:
+                result = await session.execute(select(User))
+            ```
+        """
+        if name not in self._readonly_factories:
+            raise RuntimeError(f"Session factory for '{name}' is not initialized. Call db.setup(name='{name}') first.")
+        return manage_session_ro(self._readonly_factories[name])
+
+    def sessions(self, *names: str) -> _MultiSessionCM:
+        """
+        Context Manager for obtaining NEW sessions from several engines at once.
+
+        Useful for endpoints spanning multiple databases: sessions are yielded
+        in the order the names were given, and rollback/close are gathered
+        concurrently instead of awaited one by one.
+
+        Example:
+            ```python
+            async with db.sessions("users", "analytics") as (users_s, stats_s):
+                ...
+            ```
+        """
+        return _MultiSessionCM([self.get_factory(name) for name in names])
 
     async def verify(self, name: str = DEFAULT_DB_NAME) -> bool:
         """
@@ -207,8 +446,12 @@ class DatabaseManager:
             RuntimeError: If the database is not initialized.
             Exception: If the connection test fails.
         """
-        async with self.session(name) as session:
-            await session.execute(text("SELECT 1"))
+        # A raw connection ping is enough for a liveness check; skipping the
+        # AsyncSession machinery (identity map, transaction state) keeps
+        # frequent probes (e.g. k8s) cheap.
+        engine = self.get_engine(name)
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
         logger.info(f"Database '{name}' connection verified.")
         return True
 
@@ -233,9 +476,12 @@ class DatabaseManager:
             await db.create_all(metadata=my_metadata)
             ```
         """
+        # Resolve the engine and bind create_all once, outside the async block.
+        engine = self.get_engine(name)
         target_metadata = metadata if metadata is not None else SQLModel.metadata
-        async with self.get_engine(name).begin() as conn:
-            await conn.run_sync(target_metadata.create_all)
+        create_fn = target_metadata.create_all
+        async with engine.begin() as conn:
+            await conn.run_sync(create_fn)
 
 
 # Global instance
@@ -264,18 +510,51 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+class SessionProvider:
+    """
+    Coroutine-native, class-based FastAPI dependency for a named database.
+
+    Because ``__call__`` is an async generator, FastAPI's dependency solver
+    keeps it on the event loop instead of dispatching it to the anyio
+    threadpool (the fate of sync class-based dependencies), so session
+    acquisition never competes for the 40-thread executor.
+
+    Example:
+        ```python
+        get_analytics_session = SessionProvider("analytics")
+
+        @app.get("/stats")
+        async def stats(session: AsyncSession = Depends(get_analytics_session)):
+            ...
+        ```
+    """
+
+    __slots__ = ("db_name",)
+
+    def __init__(self, db_name: str = DEFAULT_DB_NAME) -> None:
+        self.db_name = db_name
+
+    async def __call__(self) -> AsyncGenerator[AsyncSession, None]:
+        async with db.session(self.db_name) as session:
+            yield session
+
+
 async def init_db_resource(
     database_url: str,
     name: str = DEFAULT_DB_NAME,
     echo: bool = False,
     connect_args: Optional[dict] = None,
+    warmup: int = 0,
     **kwargs,
 ) -> AsyncGenerator[DatabaseManager, None]:
     """
     A helper for dependency_injector's Resource provider.
     Handles the setup and shutdown lifecycle of the global `db` instance.
+    Pass `warmup` to pre-open pool connections before the resource is yielded.
     """
     db.setup(database_url=database_url, name=name, echo=echo, connect_args=connect_args, **kwargs)
+    if warmup > 0:
+        await db.warmup_pool(name, warmup)
     try:
         yield db
     finally:
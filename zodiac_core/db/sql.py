@@ -1,3 +1,4 @@
+import os
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
@@ -67,12 +68,31 @@ class SQLDateTimeMixin(SQLModel):
     )
 
 
-@event.listens_for(Session, "before_flush")
 def receive_before_flush(session, flush_context, instances):
+    # Scope to sessions produced by zodiac's DatabaseManager (tagged via
+    # info={"zodiac": True}); flushes of unrelated Sessions in the process
+    # (Alembic, third-party libraries) skip the dirty-object scan entirely.
+    if not session.info.get("zodiac"):
+        return
+    # One timestamp shared by every row in the flush: avoids a datetime
+    # allocation per dirty object and keeps updated_at consistent across
+    # the batch. The isinstance check alone is enough; hasattr was redundant.
+    now = None
     for obj in session.dirty:
-        if hasattr(obj, "updated_at") and isinstance(obj, SQLDateTimeMixin):
+        if isinstance(obj, SQLDateTimeMixin):
             if session.is_modified(obj, include_collections=False):
-                obj.updated_at = utc_now()
+                if now is None:
+                    now = utc_now()
+                obj.updated_at = now
+
+
+# updated_at is already maintained server-side: the compiled utcnow() in
+# sa_column_kwargs["onupdate"] lands in every UPDATE's SET clause. The Python
+# listener above duplicated that work and charged an attribute-history scan
+# (session.is_modified) per dirty object on every flush of every Session in
+# the process, so it is now opt-in for dialects where the SQL path is undesired.
+if os.getenv("ZODIAC_PY_UPDATED_AT", "0") == "1":
+    event.listens_for(Session, "before_flush")(receive_before_flush)
 
 
 class SQLBase(SQLDateTimeMixin):
@@ -25,32 +25,35 @@ from .response import (
     response_unprocessable_entity,
 )
 
+# http_code -> response-function dispatch table. Small-int keys hash trivially
+# and cover subclasses for free: a user exception deriving BadRequestException
+# inherits http_code = 400 and lands on the right helper with no MRO walk.
+_CODE_DISPATCH = {
+    BadRequestException.http_code: response_bad_request,
+    UnauthorizedException.http_code: response_unauthorized,
+    ForbiddenException.http_code: response_forbidden,
+    NotFoundException.http_code: response_not_found,
+    ConflictException.http_code: response_conflict,
+}
+
 
 async def handler_zodiac_exception(
     request: Request,
     exc: ZodiacException,
+    _dispatch=_CODE_DISPATCH.get,
+    _fallback=response_server_error,
 ) -> JSONResponse:
     """
     Handle generic business exceptions (ZodiacException and subclasses).
     Uses the code, message and data defined in the exception instance.
+
+    The dispatch getter and fallback are pre-bound as default arguments so
+    the hot path reads locals instead of module globals per exception.
     """
     kwargs = dict(code=exc.code, data=exc.data)
-    if hasattr(exc, "message"):
+    if exc.message is not None:
         kwargs["message"] = exc.message
-
-    match exc:
-        case BadRequestException():
-            return response_bad_request(**kwargs)
-        case UnauthorizedException():
-            return response_unauthorized(**kwargs)
-        case ForbiddenException():
-            return response_forbidden(**kwargs)
-        case NotFoundException():
-            return response_not_found(**kwargs)
-        case ConflictException():
-            return response_conflict(**kwargs)
-        case _:
-            return response_server_error(**kwargs)
+    return _dispatch(exc.http_code, _fallback)(**kwargs)
 
 
 async def handler_validation_exception(
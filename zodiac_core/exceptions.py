@@ -4,7 +4,15 @@ from fastapi import status
 
 
 class ZodiacException(Exception):
-    """Base class for all zodiac-core related errors."""
+    """
+    Base class for all zodiac-core related errors.
+
+    Attributes are slotted so access from exception handlers is a C-level
+    slot read; `message` is always set (None by default), so handlers never
+    need a hasattr check.
+    """
+
+    __slots__ = ("code", "data", "message")
 
     http_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR
 
@@ -16,36 +24,45 @@ class ZodiacException(Exception):
     ):
         self.code = code or self.http_code
         self.data = data
-        if message is not None:
-            self.message = message
+        self.message = message
         super().__init__(message)
 
 
 class BadRequestException(ZodiacException):
     """Exception raised for 400 Bad Request errors."""
 
+    __slots__ = ()
+
     http_code = status.HTTP_400_BAD_REQUEST
 
 
 class UnauthorizedException(ZodiacException):
     """Exception raised for 401 Unauthorized errors."""
 
+    __slots__ = ()
+
     http_code = status.HTTP_401_UNAUTHORIZED
 
 
 class ForbiddenException(ZodiacException):
     """Exception raised for 403 Forbidden errors."""
 
+    __slots__ = ()
+
     http_code = status.HTTP_403_FORBIDDEN
 
 
 class NotFoundException(ZodiacException):
     """Exception raised for 404 Not Found errors."""
 
+    __slots__ = ()
+
     http_code = status.HTTP_404_NOT_FOUND
 
 
 class ConflictException(ZodiacException):
     """Exception raised for 409 Conflict errors."""
 
+    __slots__ = ()
+
     http_code = status.HTTP_409_CONFLICT
@@ -1,4 +1,5 @@
 import sys
+import traceback
 from typing import Any, Dict, Optional
 
 from loguru import logger
@@ -6,6 +7,79 @@ from pydantic import BaseModel, ConfigDict
 
 from zodiac_core.context import get_request_id
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Text-mode format template. A literal format string lets loguru parse it once
+# and apply it natively, instead of invoking a Python callable per record.
+# The patcher guarantees extra[request_id] is always populated. Loguru appends
+# the terminator and {exception} to string formats itself, so no trailing
+# newline here.
+_DEV_FORMAT = (
+    "<green>{time:YYYYMMDD HH:mm:ss}</green> "
+    "| {extra[service]} "
+    "| {extra[request_id]} "
+    "| {process.name} "
+    "| {thread.name} "
+    "| <cyan>{module}</cyan>.<cyan>{function}</cyan> "
+    "| <level>{level}</level>: "
+    "<level>{message}</level> "
+    "| {file.path}:{line}"
+)
+
+
+# JSON-mode format callable: the patcher pre-serializes each record into
+# extra[serialized], so sinks just write the ready-made line. A callable is
+# used verbatim by loguru -- unlike a string format it gets neither the
+# terminator nor "{exception}" appended, which would dump a raw traceback
+# after the JSON and corrupt the NDJSON stream.
+def _json_format(record: Dict[str, Any]) -> str:
+    return "{extra[serialized]}\n"
+
+
+def _serialize_record(record: Dict[str, Any]) -> str:
+    """
+    Serialize a loguru record with orjson (Rust-backed, ~5-10x faster than
+    stdlib json). The layout mirrors loguru's own `serialize=True` output so
+    downstream log parsers don't need to care which encoder produced a line.
+    """
+    exception = record["exception"]
+    if exception is None:
+        text = record["message"] + "\n"
+        exc_payload = None
+    else:
+        text = (
+            record["message"]
+            + "\n"
+            + "".join(traceback.format_exception(exception.type, exception.value, exception.traceback))
+        )
+        exc_payload = {
+            "type": None if exception.type is None else exception.type.__name__,
+            "value": exception.value,
+            "traceback": exception.traceback is not None,
+        }
+    payload = {
+        "text": text,
+        "record": {
+            "elapsed": {"seconds": record["elapsed"].total_seconds()},
+            "exception": exc_payload,
+            "extra": record["extra"],
+            "file": {"name": record["file"].name, "path": record["file"].path},
+            "function": record["function"],
+            "level": {"name": record["level"].name, "no": record["level"].no},
+            "line": record["line"],
+            "message": record["message"],
+            "module": record["module"],
+            "name": record["name"],
+            "process": {"id": record["process"].id, "name": record["process"].name},
+            "thread": {"id": record["thread"].id, "name": record["thread"].name},
+            "time": {"repr": str(record["time"]), "timestamp": record["time"].timestamp()},
+        },
+    }
+    return orjson.dumps(payload, default=str).decode()
+
 
 class LogFileOptions(BaseModel):
     """
@@ -36,7 +110,9 @@ def setup_loguru(
 
     Args:
         level: Logging level (INFO, DEBUG, etc.)
-        json_format: Whether to output JSON (True) or Text (False).
+        json_format: Whether to output JSON (True) or Text (False). When orjson
+            is installed (pip install 'zodiac-core[perf]'), JSON records are
+            encoded through it instead of loguru's stdlib-json serializer.
         service_name: Name of the service (added to JSON logs).
         log_file: Optional file path to save logs.
         console_options: Extra kwargs to pass to the console sink (e.g. {"enqueue": True}).
@@ -48,45 +124,39 @@ def setup_loguru(
     service = service_name
 
     # 2. Configure Patcher (Trace ID injection)
+    # Runs once per record (not per sink); an explicitly bound request_id wins,
+    # otherwise the contextvar is read once and snapshotted into extra so every
+    # sink/formatter reuses it. "-" marks records emitted outside a request.
+    use_orjson = json_format and orjson is not None
+
     def patcher(record):
-        request_id = get_request_id()
-        if request_id:
-            record["extra"]["request_id"] = request_id
-        record["extra"]["service"] = service
+        extra = record["extra"]
+        if extra.get("request_id") is None:
+            extra["request_id"] = get_request_id() or "-"
+        extra["service"] = service
+        if use_orjson:
+            # Serialize once per record; sinks emit via the _json_format callable
+            extra["serialized"] = _serialize_record(record)
 
     logger.configure(patcher=patcher)
 
-    # 3. Define Formatters
-    def _dev_formatter(record):
-        if "request_id" not in record["extra"]:
-            record["extra"]["request_id"] = "-"
-        return (
-            "<green>{time:YYYYMMDD HH:mm:ss}</green> "
-            "| {extra[service]} "
-            "| {extra[request_id]} "
-            "| {process.name} "
-            "| {thread.name} "
-            "| <cyan>{module}</cyan>.<cyan>{function}</cyan> "
-            "| <level>{level}</level>: "
-            "<level>{message}</level> "
-            "| {file.path}:{line}\n"
-        )
-
-    # 4. Prepare Console Config
+    # 3. Prepare Console Config
     c_config = console_options or {}
     c_config.setdefault("level", level)
     c_config.setdefault("sink", sys.stderr)
     c_config.setdefault("enqueue", True)  # Use thread-safe queue
 
-    if json_format:
+    if use_orjson:
+        c_config.setdefault("format", _json_format)
+    elif json_format:
         c_config.setdefault("serialize", True)
     else:
-        c_config.setdefault("format", _dev_formatter)
+        c_config.setdefault("format", _DEV_FORMAT)
 
     # Add Console Sink
     logger.add(**c_config)
 
-    # 5. Prepare File Config (if enabled)
+    # 4. Prepare File Config (if enabled)
     if log_file:
         if file_options is None:
             file_options = LogFileOptions()
@@ -97,10 +167,12 @@ def setup_loguru(
         f_config.setdefault("level", level)
         f_config.setdefault("enqueue", True)
 
-        if json_format:
+        if use_orjson:
+            f_config.setdefault("format", _json_format)
+        elif json_format:
             f_config.setdefault("serialize", True)
         else:
-            f_config.setdefault("format", _dev_formatter)
+            f_config.setdefault("format", _DEV_FORMAT)
 
         # Add File Sink
         logger.add(**f_config)
@@ -23,6 +23,8 @@ class PageParams(BaseModel):
         ```
     """
 
+    model_config = ConfigDict(frozen=True)
+
     page: int = Field(1, ge=1, description="Page number (1-based)")
     size: int = Field(20, ge=1, le=100, description="Page size")
 
@@ -44,7 +46,7 @@ class PagedResponse(BaseModel, Generic[T]):
         ```
     """
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     items: List[T] = Field(description="List of items for the current page")
     total: int = Field(description="Total number of items")
@@ -72,3 +74,32 @@ class PagedResponse(BaseModel, Generic[T]):
             page=params.page,
             size=params.size,
         )
+
+    @staticmethod
+    def create_json(
+        items: List[BaseModel],
+        total: int,
+        params: PageParams,
+    ) -> bytes:
+        """
+        Serialize a page of models straight to JSON bytes.
+
+        Each item is emitted through its class's pydantic-core serializer and
+        spliced into the fixed envelope, so a large page costs one Rust
+        serialization pass instead of model construction plus a dump. Return
+        the bytes from an endpoint via
+        ``Response(content=..., media_type="application/json")`` to also skip
+        FastAPI's response re-validation.
+
+        Args:
+            items: The list of Pydantic model instances for the current page.
+            total: The total number of records matching the query.
+            params: The PageParams object from the request.
+        """
+        items_json = b",".join(type(item).__pydantic_serializer__.to_json(item) for item in items)
+        return b'{"items":[%s],"total":%d,"page":%d,"size":%d}' % (
+            items_json,
+            total,
+            params.page,
+            params.size,
+        )
@@ -1,22 +1,95 @@
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar
 
 from fastapi import status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 T = TypeVar("T")
 
 
+class _BytesJSONResponse(JSONResponse):
+    """JSONResponse that passes pre-serialized bytes through untouched."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, (bytes, bytearray)):
+            return content
+        return super().render(content)
+
+
+class _PrebuiltJSONResponse(JSONResponse):
+    """
+    JSONResponse over a body whose bytes and headers were computed at import.
+
+    __init__ bypasses Starlette's render/init_headers work entirely; the
+    per-instance raw_headers copy keeps middleware header appends (e.g. the
+    trace ID) request-local while the shared header template and body bytes
+    are never re-encoded.
+    """
+
+    def __init__(self, status_code: int, body: bytes, headers: List[Tuple[bytes, bytes]]) -> None:
+        self.status_code = status_code
+        self.body = body
+        self.background = None
+        self.raw_headers = list(headers)
+
+
 class Response(BaseModel, Generic[T]):
     """Standard API response model."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    # frozen: the envelope is write-once; pydantic-core skips mutation
+    # bookkeeping and instances become safely shareable across requests.
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     code: int = Field(default=0, description="Business status code")
     data: Optional[T] = Field(default=None, description="Response payload")
     message: str = Field(default="Success", description="Response message")
 
 
+# Single runtime serializer: the parametrized Response[T] classes are kept for
+# OpenAPI documentation, but every payload is emitted through the base model's
+# compiled serializer regardless of how many T specializations routes declare.
+_RESPONSE_SERIALIZER = Response.__pydantic_serializer__
+
+
+# Pre-serialized bodies for the no-argument calls of the response_* helpers
+# below, keyed by (http_code, code, message) after code resolution. The
+# common error paths (e.g. a bare response_not_found()) then skip model
+# construction and serialization entirely.
+_DEFAULT_BODIES: Dict[Tuple[int, int, str], bytes] = {
+    (http_code, code, message): Response(code=code, message=message).model_dump_json().encode()
+    for http_code, code, message in (
+        (status.HTTP_200_OK, 0, "Success"),
+        (status.HTTP_201_CREATED, status.HTTP_201_CREATED, "Created"),
+        (status.HTTP_400_BAD_REQUEST, status.HTTP_400_BAD_REQUEST, "Bad Request"),
+        (status.HTTP_401_UNAUTHORIZED, status.HTTP_401_UNAUTHORIZED, "Unauthorized"),
+        (status.HTTP_403_FORBIDDEN, status.HTTP_403_FORBIDDEN, "Forbidden"),
+        (status.HTTP_404_NOT_FOUND, status.HTTP_404_NOT_FOUND, "Not Found"),
+        (status.HTTP_409_CONFLICT, status.HTTP_409_CONFLICT, "Conflict"),
+        (status.HTTP_422_UNPROCESSABLE_ENTITY, status.HTTP_422_UNPROCESSABLE_ENTITY, "Unprocessable Entity"),
+        (status.HTTP_500_INTERNAL_SERVER_ERROR, status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal Server Error"),
+    )
+}
+
+# (status_code, body, encoded header template) triples for the default bodies
+# above, so the fast path hands _PrebuiltJSONResponse everything pre-encoded.
+_PREBUILT_RESPONSES: Dict[Tuple[int, int, str], Tuple[int, bytes, List[Tuple[bytes, bytes]]]] = {
+    key: (
+        key[0],
+        body,
+        [
+            (b"content-length", str(len(body)).encode()),
+            (b"content-type", b"application/json"),
+        ],
+    )
+    for key, body in _DEFAULT_BODIES.items()
+}
+
+
 def create_response(
     http_code: int,
     code: Optional[int] = None,
@@ -35,10 +108,31 @@ def create_response(
     if code is None:
         code = http_code
 
-    response = Response(code=code, data=data, message=message)
-    return JSONResponse(
+    if data is None:
+        prebuilt = _PREBUILT_RESPONSES.get((http_code, code, message))
+        if prebuilt is not None:
+            return _PrebuiltJSONResponse(*prebuilt)
+
+    # Fast path for plain payloads (dicts, lists, scalars): the envelope has
+    # a fixed three-key shape, so splice orjson-encoded fields into a bytes
+    # template and skip the Pydantic pipeline. Anything orjson cannot encode
+    # falls through to the model path below.
+    if orjson is not None and not isinstance(data, BaseModel):
+        try:
+            return _BytesJSONResponse(
+                status_code=http_code,
+                content=b'{"code":%d,"data":%s,"message":%s}' % (code, orjson.dumps(data), orjson.dumps(message)),
+            )
+        except TypeError:
+            pass
+
+    # model_construct skips the validation pipeline (the envelope fields are
+    # built from trusted values here) and the module-level serializer emits
+    # JSON bytes directly from pydantic-core.
+    response = Response.model_construct(code=code, data=data, message=message)
+    return _BytesJSONResponse(
         status_code=http_code,
-        content=response.model_dump(mode="json"),
+        content=_RESPONSE_SERIALIZER.to_json(response),
     )
 
 
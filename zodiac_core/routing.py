@@ -1,14 +1,19 @@
 import inspect
-from functools import wraps
-from typing import Any, Callable, Dict, Optional, Union, get_origin
+from functools import lru_cache, wraps
+from typing import Any, Callable, Dict, Optional, Union, get_origin, get_type_hints
 
 from fastapi import APIRouter as FastAPIRouter
+from fastapi import Request
 from fastapi import Response as FastAPIResponse
 from fastapi.datastructures import DefaultPlaceholder  # FastAPI internal, requires >=0.128.0
 from fastapi.routing import APIRoute
 
 from zodiac_core.response import Response
 
+# Shared empty-success envelope for endpoints returning None; it is only ever
+# serialized, never mutated, so one instance serves every request.
+_EMPTY_RESPONSE = Response()
+
 
 class ZodiacRoute(APIRoute):
     """
@@ -34,16 +39,41 @@ class ZodiacRoute(APIRoute):
             response_model = self._wrap_response_model(response_model or Any)
 
         # 2. Wrap additional responses (e.g. 400, 404 models)
-        # Copy to avoid mutating caller's dict
+        # Clone lazily: the caller's dicts are only copied if some model
+        # actually needs wrapping, and only the affected entries are rebuilt.
         if responses:
-            responses = {code: {**res_dict} for code, res_dict in responses.items()}
-            for res in responses.values():
-                if "model" in res and self._should_wrap(res["model"]):
-                    res["model"] = self._wrap_response_model(res["model"])
+            wrapped = None
+            for status_code, res in responses.items():
+                model = res.get("model")
+                if model is not None and self._should_wrap(model):
+                    if wrapped is None:
+                        wrapped = dict(responses)
+                    wrapped[status_code] = {**res, "model": self._wrap_response_model(model)}
+            if wrapped is not None:
+                responses = wrapped
 
         # 3. Wrap endpoint to auto-wrap return values
         endpoint = self._wrap_endpoint(endpoint)
 
+        # 4. Fast path: a dependency-free async endpoint that already builds
+        # its own Starlette/FastAPI response needs none of FastAPI's request
+        # solving or response-field serialization; dispatch it directly.
+        # Route- and router-level dependencies (include_router merges the
+        # latter into the dependencies kwarg) still need the solver, so any
+        # declared dependency disables the fast path.
+        self._fast_path = None
+        if (
+            not kwargs.get("dependencies")
+            and inspect.iscoroutinefunction(endpoint)
+            and not inspect.signature(endpoint).parameters
+        ):
+            try:
+                return_hint = get_type_hints(endpoint).get("return")
+            except Exception:
+                return_hint = None
+            if isinstance(return_hint, type) and issubclass(return_hint, FastAPIResponse):
+                self._fast_path = endpoint
+
         super().__init__(
             path,
             endpoint,
@@ -52,9 +82,27 @@ class ZodiacRoute(APIRoute):
             **kwargs,
         )
 
+    def get_route_handler(self) -> Callable:
+        """Bypass dependency solving entirely for fast-path endpoints."""
+        if self._fast_path is not None:
+            endpoint = self._fast_path
+
+            async def fast_handler(request: Request) -> FastAPIResponse:
+                return await endpoint()
+
+            return fast_handler
+        return super().get_route_handler()
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def _should_wrap(model: Any) -> bool:
-        """Check if a model needs to be wrapped with Response[T]."""
+        """
+        Check if a model needs to be wrapped with Response[T].
+
+        Memoized: routes reuse the same handful of models, so the
+        get_origin/issubclass inspection runs once per distinct type during
+        app startup instead of once per registered route.
+        """
         if model is Any or model is None:
             return True
         origin = get_origin(model)
@@ -68,13 +116,23 @@ class ZodiacRoute(APIRoute):
         return True
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _wrap_response_model(model: Any) -> type[Response]:
-        """Wrap a model type with Response[T] using Pydantic's native generics."""
+        """
+        Wrap a model type with Response[T] using Pydantic's native generics.
+
+        Memoized: building a generic Pydantic class is expensive, and apps
+        reuse the same schema across many routes. Caching keeps it at one
+        class per distinct model (and one OpenAPI component) instead of one
+        per route.
+        """
         return Response[model]
 
     @staticmethod
     def _maybe_wrap_result(result: Any) -> Any:
         """Wrap result in Response if not already a Response type."""
+        if result is None:
+            return _EMPTY_RESPONSE
         if isinstance(result, (Response, FastAPIResponse)):
             return result
         return Response(data=result)
@@ -82,6 +140,16 @@ class ZodiacRoute(APIRoute):
     @staticmethod
     def _wrap_endpoint(endpoint: Callable) -> Callable:
         """Wrap endpoint to automatically wrap return values in Response."""
+        # Endpoints annotated as returning a Response (zodiac envelope or a
+        # Starlette/FastAPI response) never need wrapping: skip the extra
+        # coroutine frame per request and dispatch the endpoint directly.
+        try:
+            return_hint = get_type_hints(endpoint).get("return")
+        except Exception:
+            return_hint = None
+        if isinstance(return_hint, type) and issubclass(return_hint, (Response, FastAPIResponse)):
+            endpoint._zodiac_no_wrap = True
+            return endpoint
 
         @wraps(endpoint)
         async def async_wrapper(*args, **kwargs):
@@ -4,17 +4,29 @@ from uuid import UUID
 
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field
 
+# Cached so the hot path below compares against a local constant instead of
+# resolving timezone.utc per call.
+_UTC = timezone.utc
+
 
 def ensure_utc(v: Any) -> Any:
     """
     Ensure a datetime object is timezone-aware (UTC).
     If it's naive (from SQLite), attach UTC.
     If it's already aware, convert to UTC.
+
+    Runs for every datetime field of every validated row, so the common
+    cases are kept cheap: an exact type check dodges the isinstance MRO
+    walk, and an identity compare on tzinfo skips astimezone (which calls
+    tz.utcoffset) when the value is already UTC.
     """
-    if isinstance(v, datetime):
-        if v.tzinfo is None:
-            return v.replace(tzinfo=timezone.utc)
-        return v.astimezone(timezone.utc)
+    if type(v) is datetime or isinstance(v, datetime):
+        tz = v.tzinfo
+        if tz is None:
+            return v.replace(tzinfo=_UTC)
+        if tz is _UTC:
+            return v
+        return v.astimezone(_UTC)
     return v
 
 
@@ -39,6 +51,10 @@ class CoreModel(BaseModel):
 class DateTimeSchemaMixin(BaseModel):
     """Mixin for models that include standard timestamps."""
 
+    # The mixin is never validated directly; defer core-schema construction
+    # to first use so importing the module stays cheap.
+    model_config = ConfigDict(defer_build=True)
+
     created_at: UtcDatetime = Field(
         ...,
         description="The UTC timestamp when the record was created.",
@@ -61,6 +77,8 @@ class IntIDSchemaMixin(BaseModel):
 class UUIDSchemaMixin(BaseModel):
     """Mixin for models that include a UUID."""
 
+    model_config = ConfigDict(defer_build=True)
+
     id: UUID = Field(
         ...,
         description="The unique UUID identifier.",